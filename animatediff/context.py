@@ -1,4 +1,5 @@
 from typing import Union
+from bisect import bisect_left, bisect_right
 
 import torch
 import torchvision
@@ -13,7 +14,6 @@ from comfy.model_patcher import ModelPatcher
 
 from .context_extras import ContextExtrasGroup
 from .utils_model import BIGMAX_TENSOR
-from .utils_motion import get_sorted_list_via_attr
 
 
 class ContextFuseMethod:
@@ -44,6 +44,9 @@ class ContextType:
 
 
 class ContextOptions:
+    __slots__ = ("context_length", "context_stride", "context_overlap", "context_schedule", "closed_loop", "fuse_method",
+                 "sync_context_to_pe", "use_on_equal_length", "view_options", "start_percent", "start_t", "guarantee_steps", "_step")
+
     def __init__(self, context_length: int=None, context_stride: int=None, context_overlap: int=None,
                  context_schedule: str=None, closed_loop: bool=False, fuse_method: str=ContextFuseMethod.FLAT,
                  use_on_equal_length: bool=False, view_options: 'ContextOptions'=None,
@@ -91,8 +94,12 @@ class ContextOptions:
 
 
 class ContextOptionsGroup:
+    __slots__ = ("contexts", "_start_percents", "extras", "_current_context", "_current_used_steps", "_current_index", "_previous_t", "_step")
+
     def __init__(self):
         self.contexts: list[ContextOptions] = []
+        # start_percent of each context, kept parallel to contexts for sorted insertion
+        self._start_percents: list[float] = []
         self.extras = ContextExtrasGroup()
         self._current_context: ContextOptions = None
         self._current_used_steps: int = 0
@@ -126,15 +133,16 @@ class ContextOptionsGroup:
         return new_group
 
     def add(self, context: ContextOptions):
-        # add to end of list, then sort
-        self.contexts.append(context)
-        self.contexts = get_sorted_list_via_attr(self.contexts, "start_percent")
-        self._set_first_as_current()
+        # insert after any contexts with the same start_percent, keeping list sorted
+        self._insert(bisect_right(self._start_percents, context.start_percent), context)
 
     def add_to_start(self, context: ContextOptions):
-        # add to start of list, then sort
-        self.contexts.insert(0, context)
-        self.contexts = get_sorted_list_via_attr(self.contexts, "start_percent")
+        # insert before any contexts with the same start_percent, keeping list sorted
+        self._insert(bisect_left(self._start_percents, context.start_percent), context)
+
+    def _insert(self, index: int, context: ContextOptions):
+        self.contexts.insert(index, context)
+        self._start_percents.insert(index, context.start_percent)
         self._set_first_as_current()
 
     def has_index(self, index: int) -> int:
@@ -146,8 +154,9 @@ class ContextOptionsGroup:
     def clone(self):
         cloned = ContextOptionsGroup()
         cloned.extras = self.extras.clone()
-        for context in self.contexts:
-            cloned.contexts.append(context)
+        # ContextOptions are shared between clones; only the list itself needs copying
+        cloned.contexts = self.contexts.copy()
+        cloned._start_percents = self._start_percents.copy()
         cloned._set_first_as_current()
         return cloned
 
@@ -309,6 +318,12 @@ def create_windows_uniform_standard(num_frames: int, opts: Union[ContextOptionsG
     return windows
 
 
+def enumerate_windows_strided(num_frames: int, window_length: int, stride: int) -> list[list[int]]:
+    '''Returns every full window_length window over range(num_frames) whose start is a multiple of stride.'''
+    # strided view over a single arange, so no per-window python lists are built before tolist
+    return np.lib.stride_tricks.sliding_window_view(np.arange(num_frames), window_length)[::stride].tolist()
+
+
 def create_windows_static_standard(num_frames: int, opts: Union[ContextOptionsGroup, ContextOptions]):
     windows = []
     if num_frames <= opts.context_length:
@@ -316,15 +331,12 @@ def create_windows_static_standard(num_frames: int, opts: Union[ContextOptionsGr
         return windows
     # always return the same set of windows
     delta = opts.context_length - opts.context_overlap
-    for start_idx in range(0, num_frames, delta):
-        # if past the end of frames, move start_idx back to allow same context_length
-        ending = start_idx + opts.context_length
-        if ending >= num_frames:
-            final_delta = ending - num_frames
-            final_start_idx = start_idx - final_delta
-            windows.append(list(range(final_start_idx, final_start_idx + opts.context_length)))
-            break
-        windows.append(list(range(start_idx, start_idx + opts.context_length)))
+    if delta <= 0:
+        raise ValueError(f"context_overlap ({opts.context_overlap}) must be less than context_length ({opts.context_length}) for '{opts.context_schedule}' schedule.")
+    windows = enumerate_windows_strided(num_frames, opts.context_length, delta)
+    # if last window does not reach the end of frames, add one more shifted back to keep same context_length
+    if windows[-1][-1] != num_frames - 1:
+        windows.append(list(range(num_frames - opts.context_length, num_frames)))
     return windows
 
 
@@ -361,6 +373,25 @@ CONTEXT_MAPPING = {
     ContextSchedules.VIEW_AS_CONTEXT: create_windows_default,  # just return all to allow Views to do all the work
 }
 
+# schedules that always return the same windows, regardless of current step
+STEP_INDEPENDENT_SCHEDULES = {
+    ContextSchedules.STATIC_STANDARD,
+    ContextSchedules.BATCHED,
+    ContextSchedules.SVD_EXTENSION,
+    ContextSchedules.VIEW_AS_CONTEXT,
+}
+
+
+def get_context_windows_cached(num_frames: int, opts: Union[ContextOptionsGroup, ContextOptions], cache: dict) -> list[list[int]]:
+    '''Same as get_context_windows, but reuses windows already stored in cache for identical settings; returned windows must not be modified.'''
+    step = None if opts.context_schedule in STEP_INDEPENDENT_SCHEDULES else opts.step
+    key = (num_frames, opts.context_schedule, opts.context_length, opts.context_stride, opts.context_overlap, opts.closed_loop, step)
+    windows = cache.get(key, None)
+    if windows is None:
+        windows = get_context_windows(num_frames=num_frames, opts=opts)
+        cache[key] = windows
+    return windows
+
 
 def get_context_weights(length: int, full_length: int, idxs: list[int], ctx_opts: ContextOptions, sigma: Tensor=None):
     weights_func = FUSE_MAPPING.get(ctx_opts.fuse_method, None)
@@ -653,6 +684,8 @@ def generate_context_visualization(model: ModelPatcher, context_opts: ContextOpt
     context_opts = context_opts.clone()
     vs = VisualizeSettings(width, video_length)
     all_imgs = []
+    # windows are shared between steps/contexts with matching settings
+    windows_cache = {}
 
     if sigmas is None:
         sampler = comfy.samplers.KSampler(
@@ -693,10 +726,13 @@ def generate_context_visualization(model: ModelPatcher, context_opts: ContextOpt
             context_active = False
 
         if context_active:
-            context_windows = get_context_windows(num_frames=video_length, opts=context_opts)
+            context_windows = get_context_windows_cached(num_frames=video_length, opts=context_opts, cache=windows_cache)
         else:
             context_windows = [list(range(video_length))]
-        start_idx = -1
+        # first row (total length, white) is the same for every frame in this step, so only draw it once
+        base_frame: Image = Image.new(mode="RGB", size=(vs.img_width, vs.img_height), color=vs.background_color)
+        base_gd = GridDisplay(draw=ImageDraw.Draw(base_frame), vs=vs, home_x=0, home_y=vs.grid)
+        draw_first_grid_row(total_length=video_length, gd=base_gd, start_idx=context_windows[0][0])
         for j,window in enumerate(context_windows):
             repeat_count = 0
             view_windows = []
@@ -709,11 +745,11 @@ def generate_context_visualization(model: ModelPatcher, context_opts: ContextOpt
                 elif video_length == view_options.context_length and not view_options.use_on_equal_length:
                     view_active = False
                 if view_active:
-                    view_windows = get_context_windows(num_frames=len(window), opts=view_options)
+                    view_windows = get_context_windows_cached(num_frames=len(window), opts=view_options, cache=windows_cache)
                     total_repeats = len(view_windows)
             while total_repeats > repeat_count:
-                # create new frame
-                frame: Image = Image.new(mode="RGB", size=(vs.img_width, vs.img_height), color=vs.background_color)
+                # create new frame from step's base frame
+                frame: Image = base_frame.copy()
                 draw = ImageDraw.Draw(frame)
                 gd = GridDisplay(draw=draw, vs=vs, home_x=0, home_y=vs.grid)
                 # if views present, do view stuff
@@ -725,10 +761,6 @@ def generate_context_visualization(model: ModelPatcher, context_opts: ContextOpt
                 if len(view_windows) > 0:
                     title_str = f"{title_str} (View {repeat_count+1}/{len(view_windows)})"
                 draw_text(text=title_str, font=vs.title_font, gd=gd, x=0-gd.home_x, y=0-gd.home_y, centered=False)
-                # draw first row (total length, white)
-                if j == 0:
-                    start_idx = window[0]
-                draw_first_grid_row(total_length=video_length, gd=gd, start_idx=start_idx)
                 # draw context row
                 draw_context(window=window, gd=gd)
                 # save image + iterate repeat_count
@@ -1,6 +1,8 @@
 from __future__ import annotations
 from typing import TYPE_CHECKING, Union
+from collections.abc import Iterable
 import math
+from functools import lru_cache
 import torch
 from torch import Tensor
 
@@ -74,7 +76,7 @@ class ContextRefMode:
     INDEXES = "indexes"
     _LIST = [FIRST, SLIDING, INDEXES]
 
-    def __init__(self, mode: str, sliding_width=2, indexes: set[int]=set([0])):
+    def __init__(self, mode: str, sliding_width=2, indexes: frozenset[int]=frozenset([0])):
         self.mode = mode
         self.sliding_width = sliding_width
         self.indexes = indexes
@@ -89,7 +91,13 @@ class ContextRefMode:
         return ContextRefMode(cls.SLIDING, sliding_width=sliding_width)
     
     @classmethod
-    def init_indexes(cls, indexes: set[int]):
+    def init_indexes(cls, indexes: Iterable[int]):
+        return cls._init_indexes_cached(frozenset(indexes))
+
+    @classmethod
+    @lru_cache(maxsize=128)
+    def _init_indexes_cached(cls, indexes: frozenset[int]):
+        # modes are not mutated after creation, so identical indexes can share one instance
         return ContextRefMode(cls.INDEXES, indexes=indexes)
 
 
@@ -284,7 +292,7 @@ class ContextRefHandler:
             for refcn in model_options["transformer_options"][self.CONTEXTREF_CONTROL_LIST_ALL]:
                 # get mode_override if present, mode otherwise
                 self.contextref_mode = refcn.get_contextref_mode_replace() or ADGS.params.context_options.extras.context_ref.mode
-            self.contextref_idxs_set = self.contextref_mode.indexes.copy()
+            self.contextref_idxs_set = set(self.contextref_mode.indexes)
 
     def prepare_referencecn(self, ctx_idxs: list[int], window_idx: int, model_options):
         if self.contextref_active:
@@ -470,6 +478,8 @@ class NaiveReuse(ContextExtra):
         super().__init__(start_percent=start_percent, end_percent=end_percent)
         self.weighted_mean = weighted_mean
         self.orig_multival = multival_opt
+        # multival type is fixed for the extra's lifetime, so only check it once
+        self._orig_multival_is_tensor = type(multival_opt) == Tensor
         self.mask: Tensor = None
         self.keyframe = naivereuse_kf if naivereuse_kf else NaiveReuseKeyframeGroup()
         self._prev_keyframe = None
@@ -498,7 +508,7 @@ class NaiveReuse(ContextExtra):
             keyframe_changed = True
         self._prev_keyframe = self.keyframe._current_keyframe
 
-        if type(self.orig_multival) != Tensor and type(self.keyframe.mult_multival) != Tensor:
+        if not self._orig_multival_is_tensor and type(self.keyframe.mult_multival) != Tensor:
             return self.weighted_mean * self.keyframe.mult * get_combined_multival(self.orig_multival, self.keyframe.mult_multival)
 
         if self.mask is None or keyframe_changed or self.mask.shape[0] != x.shape[0] or self.mask.shape[-1] != x.shape[-1] or self.mask.shape[-2] != x.shape[-2]:
@@ -558,6 +568,8 @@ class NaiveReuseHandler:
 
 
 class ContextExtrasGroup:
+    __slots__ = ("context_ref", "naive_reuse")
+
     def __init__(self):
         self.context_ref: ContextRef = None
         self.naive_reuse: NaiveReuse = None